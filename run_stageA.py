@@ -16,10 +16,17 @@ This script:
 from __future__ import annotations
 
 import argparse
+import contextlib
+import importlib.util
+import io
+import os
 import subprocess
 import sys
+import tempfile
+import unittest
 from datetime import datetime
 from pathlib import Path
+from typing import Callable, Iterator
 
 
 def run_command(cmd: list[str], description: str, verbose: bool = False) -> bool:
@@ -32,24 +39,31 @@ def run_command(cmd: list[str], description: str, verbose: bool = False) -> bool
         print(f"  Command: {' '.join(cmd)}")
     
     try:
-        result = subprocess.run(
-            cmd,
-            capture_output=not verbose,
-            text=True,
-            cwd=Path(__file__).parent
-        )
+        if verbose:
+            # Inherit the terminal directly; nothing to capture
+            result = subprocess.run(cmd, cwd=Path(__file__).parent)
+            output = ""
+        else:
+            # Spool to a temp file; only read it back on failure
+            with tempfile.TemporaryFile() as tf:
+                result = subprocess.run(
+                    cmd,
+                    stdout=tf,
+                    stderr=subprocess.STDOUT,
+                    cwd=Path(__file__).parent
+                )
+                output = ""
+                if result.returncode != 0:
+                    tf.seek(0)
+                    output = tf.read().decode("utf-8", errors="replace")
         
         if result.returncode == 0:
             print(f"✅ {description} — PASSED")
-            if verbose and result.stdout:
-                print(result.stdout)
             return True
         else:
             print(f"❌ {description} — FAILED")
-            if result.stdout:
-                print(result.stdout)
-            if result.stderr:
-                print(result.stderr, file=sys.stderr)
+            if output:
+                print(output, file=sys.stderr)
             return False
             
     except Exception as e:
@@ -57,6 +71,72 @@ def run_command(cmd: list[str], description: str, verbose: bool = False) -> bool
         return False
 
 
+@contextlib.contextmanager
+def _working_dir(path: Path) -> Iterator[None]:
+    """Temporarily chdir (contextlib.chdir is Python 3.11+ only)."""
+    prev = os.getcwd()
+    os.chdir(path)
+    try:
+        yield
+    finally:
+        os.chdir(prev)
+
+
+def run_in_repo(func: Callable[[], int], repo_root: Path) -> int:
+    """Call func with the repo root as working directory.
+    
+    Relative defaults in the tools (e.g. batch_validator's stageA/_reports)
+    then resolve against the repo, as they did when run as a subprocess.
+    """
+    with _working_dir(repo_root):
+        return func()
+
+
+def run_inprocess(func: Callable[[], int], description: str, verbose: bool = False) -> bool:
+    """Run a callable returning an exit code in-process and return success status.
+    
+    Output is captured (and only shown on failure) unless verbose.
+    """
+    print(f"\n{'='*60}")
+    print(f"▶ {description}")
+    print(f"{'='*60}")
+    
+    out, err = io.StringIO(), io.StringIO()
+    try:
+        if verbose:
+            rc = func()
+        else:
+            with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+                rc = func()
+    except SystemExit as e:
+        rc = e.code if isinstance(e.code, int) else 1
+    except Exception as e:
+        print(f"❌ {description} — ERROR: {e}")
+        return False
+    
+    if rc == 0:
+        print(f"✅ {description} — PASSED")
+        return True
+    
+    print(f"❌ {description} — FAILED")
+    if out.getvalue():
+        print(out.getvalue())
+    if err.getvalue():
+        print(err.getvalue(), file=sys.stderr)
+    return False
+
+
+def run_unit_tests(repo_root: Path, verbose: bool = False) -> int:
+    """Discover and run Stage A unit tests; return exit code."""
+    suite = unittest.defaultTestLoader.discover(
+        start_dir=str(repo_root / "stageA" / "tests"),
+        pattern="test_*.py",
+        top_level_dir=str(repo_root),
+    )
+    result = unittest.TextTestRunner(verbosity=2 if verbose else 0).run(suite)
+    return 0 if result.wasSuccessful() else 1
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(
         description="One-click Stage A validation"
@@ -91,42 +171,54 @@ def main() -> int:
     
     results = []
     
-    # Step 1: Validate contracts
-    validate_cmd = [
-        sys.executable,
-        "stageA/tools/batch_validator.py",
-        "stageA/contracts",
-        "--glossary", "stageA/glossary/glossary_v1.json",
-        "--schema", "stageA/schema/contract_schema_stageA_v4.json",
+    # Step 1: Validate contracts (in-process)
+    from stageA.tools.batch_validator import main as validate_main
+    
+    validate_args = [
+        str(repo_root / "stageA" / "contracts"),
+        "--glossary", str(repo_root / "stageA" / "glossary" / "glossary_v1.json"),
+        "--schema", str(repo_root / "stageA" / "schema" / "contract_schema_stageA_v4.json"),
     ]
     
     if not args.no_reports:
         reports_dir.mkdir(parents=True, exist_ok=True)
-        validate_cmd.extend(["--out", str(reports_dir)])
+        validate_args.extend(["--out", str(reports_dir)])
     
     if args.verbose:
-        validate_cmd.append("--verbose")
+        validate_args.append("--verbose")
     
-    results.append(run_command(
-        validate_cmd,
+    results.append(run_inprocess(
+        lambda: run_in_repo(lambda: validate_main(validate_args), repo_root),
         "Contract Validation",
         verbose=args.verbose
     ))
     
     # Step 2: Run tests (unless --quick)
     if not args.quick:
-        test_cmd = [
-            sys.executable, "-m", "unittest",
-            "discover", "-s", "stageA/tests",
-            "-p", "test_*.py",
-            "-v" if args.verbose else "-q"
-        ]
-        
-        results.append(run_command(
-            test_cmd,
-            "Unit Tests",
-            verbose=args.verbose
-        ))
+        # Prefer the parallel runner when installed for this interpreter.
+        # stageA/tests is a single module, so split per class; each worker
+        # builds its own (read-only) _StageAFixtures.
+        if importlib.util.find_spec("unittest_parallel") is not None:
+            test_cmd = [
+                sys.executable, "-m", "unittest_parallel",
+                "-t", ".",
+                "-s", "stageA/tests",
+                "-p", "test_*.py",
+                "-j", str(os.cpu_count() or 4),
+                "--level", "class",
+                "-v" if args.verbose else "-q",
+            ]
+            results.append(run_command(
+                test_cmd,
+                "Unit Tests (parallel)",
+                verbose=args.verbose
+            ))
+        else:
+            results.append(run_inprocess(
+                lambda: run_unit_tests(repo_root, verbose=args.verbose),
+                "Unit Tests",
+                verbose=args.verbose
+            ))
     
     # Summary
     print(f"\n{'='*60}")
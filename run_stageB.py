@@ -15,6 +15,7 @@ from __future__ import annotations
 import argparse
 import subprocess
 import sys
+import tempfile
 from pathlib import Path
 from typing import List, Optional
 
@@ -30,25 +31,30 @@ def run_command(cmd: List[str], description: str, verbose: bool = False) -> bool
     if verbose:
         print(f"Command: {' '.join(cmd)}")
 
-    result = subprocess.run(
-        cmd,
-        cwd=str(REPO_ROOT),
-        text=True,
-        capture_output=not verbose,
-    )
+    output = ""
+    if verbose:
+        # Inherit the terminal directly; nothing to capture
+        result = subprocess.run(cmd, cwd=str(REPO_ROOT))
+    else:
+        # Spool to a temp file; only read it back on failure
+        with tempfile.TemporaryFile() as tf:
+            result = subprocess.run(
+                cmd,
+                cwd=str(REPO_ROOT),
+                stdout=tf,
+                stderr=subprocess.STDOUT,
+            )
+            if result.returncode != 0:
+                tf.seek(0)
+                output = tf.read().decode("utf-8", errors="replace")
 
     if result.returncode == 0:
-        if verbose and result.stdout:
-            print(result.stdout)
         print(f"✅ {description} — PASSED")
         return True
 
     # Show output on failure
-    if not verbose:
-        if result.stdout:
-            print(result.stdout)
-        if result.stderr:
-            print(result.stderr, file=sys.stderr)
+    if output:
+        print(output, file=sys.stderr)
     print(f"❌ {description} — FAILED")
     return False
 
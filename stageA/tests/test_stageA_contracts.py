@@ -11,27 +11,129 @@ Tests:
 
 from __future__ import annotations
 
+import functools
 import json
 import sys
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Set
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
+try:  # optional: faster JSON parsing
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
 
+
+@functools.lru_cache(maxsize=1)
 def _repo_root() -> Path:
     """Get repository root from this file location."""
     return Path(__file__).resolve().parents[2]
 
 
+_REPO = _repo_root()
+_STAGE_A = _REPO / "stageA"
+_CONTRACTS_DIR = _STAGE_A / "contracts"
+_SCHEMA_PATH = _STAGE_A / "schema" / "contract_schema_stageA_v4.json"
+_GLOSSARY_PATH = _STAGE_A / "glossary" / "glossary_v1.json"
+_KATALOG_PATH = _STAGE_A / "katalog" / "katalog_4_0.json"
+
+# Required top-level contract fields
+_REQUIRED_TOP_LEVEL = frozenset({
+    "_schema", "module_id", "module_abbr", "module_type",
+    "module_name", "version", "description", "io_contract",
+    "parameters", "parameter_groups", "constraints",
+    "validation", "error_codes", "algorithm", "relations",
+    "test_cases", "policies",
+})
+
+
 def _load_json(path: Path) -> Dict[str, Any]:
-    """Load JSON file with UTF-8 encoding."""
-    with path.open("r", encoding="utf-8") as f:
-        return json.load(f)
+    """Load JSON file with UTF-8 encoding (orjson if installed)."""
+    raw = path.read_bytes()
+    if _orjson is not None:
+        return _orjson.loads(raw)
+    return json.loads(raw.decode("utf-8"))
+
+
+@functools.lru_cache(maxsize=None)
+def _load_json_cached(path_str: str, mtime_ns: int) -> Dict[str, Any]:
+    """Load JSON once per (path, mtime). Result is shared — treat as read-only."""
+    return _load_json(Path(path_str))
+
+
+def _load_json_shared(path: Path) -> Dict[str, Any]:
+    """Load JSON through the (path, mtime) cache."""
+    return _load_json_cached(str(path), path.stat().st_mtime_ns)
+
+
+def _try_load_json_shared(path: Path) -> Tuple[Optional[Dict[str, Any]], Optional[Exception]]:
+    """Load JSON through the cache; return (data, None) or (None, error)."""
+    try:
+        return _load_json_shared(path), None
+    except Exception as e:
+        return None, e
+
+
+def _load_all(
+    paths: Iterable[Path],
+) -> Tuple[Dict[Path, Dict[str, Any]], Dict[Path, Exception]]:
+    """Load several JSON files concurrently (I/O-bound), preserving order.
+    
+    Returns (parsed, errors); a file that fails to load is recorded in
+    errors instead of aborting the whole batch.
+    """
+    paths = list(paths)
+    with ThreadPoolExecutor(max_workers=min(32, len(paths) or 1)) as ex:
+        loaded = list(ex.map(_try_load_json_shared, paths))
+    
+    parsed: Dict[Path, Dict[str, Any]] = {}
+    errors: Dict[Path, Exception] = {}
+    for path, (data, err) in zip(paths, loaded):
+        if err is None:
+            parsed[path] = data
+        else:
+            errors[path] = err
+    return parsed, errors
 
 
-def _find_contracts(contracts_dir: Path) -> List[Path]:
+@functools.lru_cache(maxsize=None)
+def _find_contracts(contracts_dir: Path) -> Tuple[Path, ...]:
     """Find all Stage A contract files."""
-    return sorted(contracts_dir.glob("*_contract_stageA*.json"))
+    return tuple(sorted(contracts_dir.glob("*_contract_stageA*.json")))
+
+
+class _StageAFixtures:
+    """Read-only Stage A fixtures shared by all test classes.
+
+    Built lazily on first access via get(); every JSON file is parsed once.
+    """
+
+    _instance: Optional["_StageAFixtures"] = None
+
+    def __init__(self) -> None:
+        self.repo_root = _REPO
+        self.stageA_dir = _STAGE_A
+        self.contracts_dir = _CONTRACTS_DIR
+        self.contracts = _find_contracts(self.contracts_dir)
+        # Unparseable contracts are kept out of contract_data and reported
+        # by TestStageAContractsStructure.test_contracts_valid_json.
+        self.contract_json, self.contract_load_errors = _load_all(self.contracts)
+        self.contract_data: List[Dict[str, Any]] = list(self.contract_json.values())
+
+        self.schema_path = _SCHEMA_PATH
+        self.glossary_path = _GLOSSARY_PATH
+        self.katalog_path = _KATALOG_PATH
+
+        self.schema = _load_json_shared(self.schema_path) if self.schema_path.exists() else {}
+        self.glossary = _load_json_shared(self.glossary_path) if self.glossary_path.exists() else {}
+        self.katalog = _load_json_shared(self.katalog_path) if self.katalog_path.exists() else {}
+
+    @classmethod
+    def get(cls) -> "_StageAFixtures":
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
 
 
 class TestStageAContractsStructure(unittest.TestCase):
@@ -39,18 +141,14 @@ class TestStageAContractsStructure(unittest.TestCase):
     
     @classmethod
     def setUpClass(cls) -> None:
-        cls.repo_root = _repo_root()
-        cls.stageA_dir = cls.repo_root / "stageA"
-        cls.contracts_dir = cls.stageA_dir / "contracts"
-        cls.contracts = _find_contracts(cls.contracts_dir)
-        
-        # Load schema
-        schema_path = cls.stageA_dir / "schema" / "contract_schema_stageA_v4.json"
-        cls.schema = _load_json(schema_path) if schema_path.exists() else {}
-        
-        # Load glossary
-        glossary_path = cls.stageA_dir / "glossary" / "glossary_v1.json"
-        cls.glossary = _load_json(glossary_path) if glossary_path.exists() else {}
+        fx = _StageAFixtures.get()
+        cls.repo_root = fx.repo_root
+        cls.stageA_dir = fx.stageA_dir
+        cls.contracts_dir = fx.contracts_dir
+        cls.contracts = fx.contracts
+        cls.contract_json = fx.contract_json
+        cls.schema = fx.schema
+        cls.glossary = fx.glossary
     
     def test_contracts_exist(self):
         """At least one contract exists."""
@@ -61,36 +159,37 @@ class TestStageAContractsStructure(unittest.TestCase):
         for path in self.contracts:
             with self.subTest(contract=path.name):
                 try:
-                    _load_json(path)
+                    _load_json_shared(path)
                 except Exception as e:
                     self.fail(f"Invalid JSON: {e}")
     
     def test_contracts_have_required_fields(self):
         """All contracts have required top-level fields."""
-        required = [
-            "_schema", "module_id", "module_abbr", "module_type",
-            "module_name", "version", "description", "io_contract",
-            "parameters", "parameter_groups", "constraints",
-            "validation", "error_codes", "algorithm", "relations",
-            "test_cases", "policies"
-        ]
+        missing = []
+        for path, data in self.contract_json.items():
+            miss = _REQUIRED_TOP_LEVEL - data.keys()
+            if miss:
+                missing.append((path.name, sorted(miss)))
         
-        for path in self.contracts:
-            with self.subTest(contract=path.name):
-                data = _load_json(path)
-                for field in required:
-                    self.assertIn(field, data, f"Missing field: {field}")
+        self.assertFalse(missing, f"Missing fields: {missing}")
     
     def test_schema_block_valid(self):
         """All contracts have valid _schema block."""
-        for path in self.contracts:
-            with self.subTest(contract=path.name):
-                data = _load_json(path)
-                schema = data.get("_schema", {})
-                
-                self.assertEqual(schema.get("name"), "A-PRACTICAL.contract")
-                self.assertEqual(schema.get("stage"), "A.contract_only")
-                self.assertIn(schema.get("maturity_stage"), ["pilot", "draft", "stable"])
+        problems = []
+        for path, data in self.contract_json.items():
+            schema = data.get("_schema", {})
+            
+            bad = []
+            if schema.get("name") != "A-PRACTICAL.contract":
+                bad.append(f"name={schema.get('name')!r}")
+            if schema.get("stage") != "A.contract_only":
+                bad.append(f"stage={schema.get('stage')!r}")
+            if schema.get("maturity_stage") not in ["pilot", "draft", "stable"]:
+                bad.append(f"maturity_stage={schema.get('maturity_stage')!r}")
+            if bad:
+                problems.append((path.name, bad))
+        
+        self.assertFalse(problems, f"Invalid _schema blocks: {problems}")
 
 
 class TestStageAContractsValidation(unittest.TestCase):
@@ -98,49 +197,61 @@ class TestStageAContractsValidation(unittest.TestCase):
     
     @classmethod
     def setUpClass(cls) -> None:
-        cls.repo_root = _repo_root()
-        cls.stageA_dir = cls.repo_root / "stageA"
+        fx = _StageAFixtures.get()
+        cls.repo_root = fx.repo_root
+        cls.stageA_dir = fx.stageA_dir
         
         # Import validator (clean import via package)
         try:
-            from stageA.lint import ContractLintValidator
+            from stageA.lint import ContractLintValidator, LintResult
         except ImportError:
             # Fallback for direct execution
-            repo_root = _repo_root()
-            if str(repo_root) not in sys.path:
-                sys.path.insert(0, str(repo_root))
-            from stageA.lint import ContractLintValidator
-        
-        schema_path = cls.stageA_dir / "schema" / "contract_schema_stageA_v4.json"
-        glossary_path = cls.stageA_dir / "glossary" / "glossary_v1.json"
+            if str(_REPO) not in sys.path:
+                sys.path.insert(0, str(_REPO))
+            from stageA.lint import ContractLintValidator, LintResult
         
         cls.validator = ContractLintValidator(
-            schema_path=schema_path,
-            glossary_path=glossary_path if glossary_path.exists() else None
+            schema_path=fx.schema_path,
+            glossary_path=fx.glossary_path if fx.glossary_path.exists() else None
         )
         
-        cls.contracts_dir = cls.stageA_dir / "contracts"
-        cls.contracts = _find_contracts(cls.contracts_dir)
+        cls.contracts_dir = fx.contracts_dir
+        cls.contracts = fx.contracts
+        
+        # Validate each contract once; both tests read the cached result.
+        # A contract the validator cannot process is recorded in _errors
+        # instead of aborting the class.
+        cls._results: Dict[Path, LintResult] = {}
+        cls._errors: Dict[Path, Exception] = {}
+        for p in cls.contracts:
+            try:
+                cls._results[p] = cls.validator.validate_contract(p)
+            except Exception as e:
+                cls._errors[p] = e
     
     def test_all_contracts_pass_validation(self):
         """All contracts pass lint validation."""
+        failures = []
         for path in self.contracts:
-            with self.subTest(contract=path.name):
-                result = self.validator.validate_contract(path)
-                
-                if not result.passed:
-                    errors = [f"{e.code}: {e.message}" for e in result.errors]
-                    self.fail(f"Validation failed:\n" + "\n".join(errors))
+            if path in self._errors:
+                failures.append(f"{path.name}:\n  {self._errors[path]}")
+                continue
+            result = self._results[path]
+            if not result.passed:
+                errors = [f"  {e.code}: {e.message}" for e in result.errors]
+                failures.append(f"{path.name}:\n" + "\n".join(errors))
+        
+        if failures:
+            self.fail("Validation failed:\n" + "\n".join(failures))
     
     def test_all_contracts_score_above_90(self):
         """All contracts score at least 90/100."""
-        for path in self.contracts:
-            with self.subTest(contract=path.name):
-                result = self.validator.validate_contract(path)
-                self.assertGreaterEqual(
-                    result.score, 90,
-                    f"Score {result.score} below threshold"
-                )
+        low = [
+            (path.name, self._results[path].score if path in self._results else "ERROR")
+            for path in self.contracts
+            if path in self._errors or self._results[path].score < 90
+        ]
+        self.assertFalse(low, f"Scores below threshold: {low}")
 
 
 class TestStageACatalogSync(unittest.TestCase):
@@ -148,53 +259,49 @@ class TestStageACatalogSync(unittest.TestCase):
     
     @classmethod
     def setUpClass(cls) -> None:
-        cls.repo_root = _repo_root()
-        cls.stageA_dir = cls.repo_root / "stageA"
+        fx = _StageAFixtures.get()
+        cls.repo_root = fx.repo_root
+        cls.stageA_dir = fx.stageA_dir
+        cls.katalog = fx.katalog
         
-        # Load catalog
-        katalog_path = cls.stageA_dir / "katalog" / "katalog_4_0.json"
-        cls.katalog = _load_json(katalog_path) if katalog_path.exists() else {}
-        
-        # Load contracts
-        cls.contracts_dir = cls.stageA_dir / "contracts"
+        # Index contracts by module_id
+        cls.contracts_dir = fx.contracts_dir
         cls.contracts: Dict[str, Dict[str, Any]] = {}
-        for path in _find_contracts(cls.contracts_dir):
-            data = _load_json(path)
+        for data in fx.contract_data:
             cls.contracts[data.get("module_id", "")] = data
     
     def test_catalog_modules_exist(self):
         """All catalog modules have corresponding contracts."""
-        for module in self.katalog.get("modules", []):
-            module_id = module.get("module_id")
-            with self.subTest(module_id=module_id):
-                self.assertIn(
-                    module_id, self.contracts,
-                    f"Contract not found for catalog entry"
-                )
+        missing = [
+            module.get("module_id")
+            for module in self.katalog.get("modules", [])
+            if module.get("module_id") not in self.contracts
+        ]
+        self.assertFalse(missing, f"Contract not found for catalog entries: {missing}")
     
     def test_catalog_versions_match(self):
         """Catalog versions match contract versions."""
+        mismatches = []
         for module in self.katalog.get("modules", []):
             module_id = module.get("module_id")
             if module_id in self.contracts:
-                with self.subTest(module_id=module_id):
-                    self.assertEqual(
-                        module.get("version"),
-                        self.contracts[module_id].get("version"),
-                        "Version mismatch"
-                    )
+                contract_version = self.contracts[module_id].get("version")
+                if module.get("version") != contract_version:
+                    mismatches.append((module_id, module.get("version"), contract_version))
+        
+        self.assertFalse(mismatches, f"Version mismatch (catalog, contract): {mismatches}")
     
     def test_catalog_abbr_match(self):
         """Catalog abbreviations match contract abbreviations."""
+        mismatches = []
         for module in self.katalog.get("modules", []):
             module_id = module.get("module_id")
             if module_id in self.contracts:
-                with self.subTest(module_id=module_id):
-                    self.assertEqual(
-                        module.get("module_abbr"),
-                        self.contracts[module_id].get("module_abbr"),
-                        "Abbreviation mismatch"
-                    )
+                contract_abbr = self.contracts[module_id].get("module_abbr")
+                if module.get("module_abbr") != contract_abbr:
+                    mismatches.append((module_id, module.get("module_abbr"), contract_abbr))
+        
+        self.assertFalse(mismatches, f"Abbreviation mismatch (catalog, contract): {mismatches}")
 
 
 class TestStageAGlossaryCoverage(unittest.TestCase):
@@ -202,17 +309,14 @@ class TestStageAGlossaryCoverage(unittest.TestCase):
     
     @classmethod
     def setUpClass(cls) -> None:
-        cls.repo_root = _repo_root()
-        cls.stageA_dir = cls.repo_root / "stageA"
-        
-        # Load glossary
-        glossary_path = cls.stageA_dir / "glossary" / "glossary_v1.json"
-        cls.glossary = _load_json(glossary_path) if glossary_path.exists() else {}
+        fx = _StageAFixtures.get()
+        cls.repo_root = fx.repo_root
+        cls.stageA_dir = fx.stageA_dir
+        cls.glossary = fx.glossary
         cls.terms = set(cls.glossary.get("terms", {}).keys())
         
-        # Load contracts
-        cls.contracts_dir = cls.stageA_dir / "contracts"
-        cls.contracts = [_load_json(p) for p in _find_contracts(cls.contracts_dir)]
+        cls.contracts_dir = fx.contracts_dir
+        cls.contracts = fx.contract_data
     
     def test_module_abbrs_in_glossary(self):
         """All module abbreviations are defined in glossary."""
@@ -230,15 +334,22 @@ class TestStageAErrorCodeConsistency(unittest.TestCase):
     
     @classmethod
     def setUpClass(cls) -> None:
-        cls.repo_root = _repo_root()
-        cls.contracts_dir = cls.repo_root / "stageA" / "contracts"
-        cls.contracts = [_load_json(p) for p in _find_contracts(cls.contracts_dir)]
+        fx = _StageAFixtures.get()
+        cls.repo_root = fx.repo_root
+        cls.contracts_dir = fx.contracts_dir
+        cls.contracts = fx.contract_data
+        
+        # Precomputed once, index-aligned with cls.contracts
+        cls.codes_by_contract: List[List[str]] = [
+            [ec.get("code") for ec in c.get("error_codes", [])]
+            for c in cls.contracts
+        ]
+        cls.defined_codes: List[Set[str]] = [set(codes) for codes in cls.codes_by_contract]
     
     def test_error_codes_unique_within_contract(self):
         """Error codes are unique within each contract."""
-        for contract in self.contracts:
+        for contract, codes in zip(self.contracts, self.codes_by_contract):
             with self.subTest(module_id=contract.get("module_id")):
-                codes = [ec.get("code") for ec in contract.get("error_codes", [])]
                 self.assertEqual(
                     len(codes), len(set(codes)),
                     "Duplicate error codes found"
@@ -246,9 +357,8 @@ class TestStageAErrorCodeConsistency(unittest.TestCase):
     
     def test_constraints_reference_defined_codes(self):
         """All constraint error codes are defined."""
-        for contract in self.contracts:
+        for contract, defined in zip(self.contracts, self.defined_codes):
             with self.subTest(module_id=contract.get("module_id")):
-                defined = {ec.get("code") for ec in contract.get("error_codes", [])}
                 for c in contract.get("constraints", []):
                     code = c.get("error_code")
                     self.assertIn(
@@ -258,9 +368,8 @@ class TestStageAErrorCodeConsistency(unittest.TestCase):
     
     def test_validation_rules_reference_defined_codes(self):
         """All validation rule codes are defined."""
-        for contract in self.contracts:
+        for contract, defined in zip(self.contracts, self.defined_codes):
             with self.subTest(module_id=contract.get("module_id")):
-                defined = {ec.get("code") for ec in contract.get("error_codes", [])}
                 for rule in contract.get("validation", {}).get("rules", []):
                     code = rule.get("error_code")
                     self.assertIn(
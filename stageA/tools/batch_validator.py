@@ -69,7 +69,7 @@ def _find_contracts(root: Path, exclude_dir: Optional[Path] = None) -> List[Path
     return contracts
 
 
-def main() -> int:
+def main(argv: Optional[List[str]] = None) -> int:
     parser = argparse.ArgumentParser(
         description="Batch validate Stage A contracts"
     )
@@ -107,7 +107,7 @@ def main() -> int:
         help="Verbose output"
     )
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     # Resolve paths
     contracts_root = Path(args.contracts_root).resolve()
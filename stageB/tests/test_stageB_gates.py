@@ -13,13 +13,31 @@ These tests do NOT check Stage C logic; only Stage B guarantees.
 
 from __future__ import annotations
 
+import contextlib
+import functools
 import hashlib
+import io
+import itertools
 import json
-import subprocess
-import sys
+import os
+import traceback
 import unittest
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from importlib import import_module
 from pathlib import Path
-from typing import Dict, List, Set
+from types import MappingProxyType, ModuleType, SimpleNamespace
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+try:  # optional: faster content fingerprints
+    import blake3 as _blake3
+except ImportError:
+    _blake3 = None
+
+try:  # optional: faster JSON parsing
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
 
 REPO_ROOT = Path(__file__).resolve().parents[2]
 CONTRACTS_DIR = REPO_ROOT / "stageA" / "contracts"
@@ -40,30 +58,75 @@ MANUAL_FILES = [
     "__init__.py",
 ]
 
+AUTOGEN_SUBMODULES = [
+    "config_autogen",
+    "io_types_autogen",
+    "validators_autogen",
+    "pipeline_autogen",
+    "cli_autogen",
+]
+
+
+def _loads(raw: bytes) -> Any:
+    """Parse UTF-8 JSON bytes (orjson if installed)."""
+    if _orjson is not None:
+        return _orjson.loads(raw)
+    return json.loads(raw.decode("utf-8"))
+
+
+@functools.lru_cache(maxsize=1)
+def _discover_contract_abbrs() -> Tuple[str, ...]:
+    """Discover module_abbr list from Stage A contracts.
 
-def _discover_contract_abbrs() -> List[str]:
-    """Discover module_abbr list from Stage A contracts."""
+    Cached: contracts do not change during a test run.
+    """
     abbrs: List[str] = []
     for p in sorted(CONTRACTS_DIR.glob("*_contract_stageA_FINAL.json")):
         try:
-            data = json.loads(p.read_text(encoding="utf-8"))
+            data = _loads(p.read_bytes())
             abbr = str(data.get("module_abbr") or "").strip().upper()
             if abbr:
                 abbrs.append(abbr)
         except Exception:
             continue
 
-    seen: Set[str] = set()
-    out: List[str] = []
-    for a in abbrs:
-        if a not in seen:
-            out.append(a)
-            seen.add(a)
-    return out
+    # Deduplicate, preserving order
+    return tuple(dict.fromkeys(abbrs))
+
+
+_HASH_CHUNK_SIZE = 64 * 1024
+
+
+def _new_hasher():
+    """Content fingerprint hasher (blake3 if installed, else sha256).
+
+    Hashes are only compared within a single test run, so the algorithm is
+    not pinned.
+    """
+    return _blake3.blake3() if _blake3 is not None else hashlib.sha256()
+
+
+def _hash_file(p: Path) -> str:
+    """Stream a file into the hasher without reading it fully into memory."""
+    with p.open("rb", buffering=0) as f:
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+
+            return hashlib.file_digest(f, _new_hasher).hexdigest()
+        h = _new_hasher()
+        for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b""):
+            h.update(chunk)
+        return h.hexdigest()
+
+
+def _read_bytes_if_exists(p: Path) -> Optional[bytes]:
+    """Read file bytes, or None if it cannot be read."""
+    try:
+        return p.read_bytes()
+    except OSError:
+        return None
 
 
 def _autogen_files_tree_hash() -> Dict[str, str]:
-    """Return mapping relpath -> sha256 for all *_autogen.* files."""
+    """Return mapping relpath -> content hash for all *_autogen.* files."""
     out: Dict[str, str] = {}
     if not MODULES_DIR.exists():
         return out
@@ -71,53 +134,145 @@ def _autogen_files_tree_hash() -> Dict[str, str]:
     for p in sorted(MODULES_DIR.rglob("*_autogen.*")):
         if p.is_file():
             rel = p.relative_to(REPO_ROOT).as_posix()
-            out[rel] = hashlib.sha256(p.read_bytes()).hexdigest()
+            out[rel] = _hash_file(p)
     return out
 
 
 def _manual_files_hash_if_exist() -> Dict[str, str]:
-    """Return mapping relpath -> sha256 for manual files that already exist."""
+    """Return mapping relpath -> content hash for manual files that already exist."""
     out: Dict[str, str] = {}
     if not MODULES_DIR.exists():
         return out
 
-    for p in sorted(MODULES_DIR.rglob("*")):
+    manual_paths = itertools.chain.from_iterable(
+        MODULES_DIR.rglob(name) for name in MANUAL_FILES
+    )
+    for p in sorted(manual_paths):
         if not p.is_file():
             continue
-        if p.name not in MANUAL_FILES:
-            continue
         rel = p.relative_to(REPO_ROOT).as_posix()
-        out[rel] = hashlib.sha256(p.read_bytes()).hexdigest()
+        out[rel] = _hash_file(p)
     return out
 
 
-def _run_generator() -> subprocess.CompletedProcess:
-    """Run the Stage B generator."""
-    return subprocess.run(
-        [sys.executable, "-m", "stageB.generator.generate_module", "--all"],
-        cwd=str(REPO_ROOT),
-        text=True,
-        capture_output=True,
+def _run_generator() -> SimpleNamespace:
+    """Run the Stage B generator in-process (same as ``--all`` CLI).
+
+    Returns an object shaped like ``subprocess.CompletedProcess``
+    (returncode / stdout / stderr).
+    """
+    from stageB.generator.generate_module import main as gen_main
+
+    out, err = io.StringIO(), io.StringIO()
+    with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+        try:
+            rc = gen_main(["--all"])
+        except SystemExit as e:
+            rc = e.code if isinstance(e.code, int) else 1
+        except Exception:
+            traceback.print_exc()
+            rc = 1
+    return SimpleNamespace(returncode=rc, stdout=out.getvalue(), stderr=err.getvalue())
+
+
+def _import_autogen(abbr: str) -> Tuple[str, Dict[str, ModuleType], Dict[str, str]]:
+    """Import all autogen submodules of one generated module.
+
+    Returns (abbr, modules, errors); a submodule that fails to import is
+    recorded in errors as "ExcType: message" instead of raising.
+    """
+    mods: Dict[str, ModuleType] = {}
+    errors: Dict[str, str] = {}
+    for name in AUTOGEN_SUBMODULES:
+        try:
+            mods[name] = import_module(f"stageB.modules.{abbr}.{name}")
+        except Exception as e:
+            errors[name] = f"{type(e).__name__}: {e}"
+    return abbr, mods, errors
+
+
+def _import_all_autogen(
+    abbrs: Sequence[str],
+) -> Tuple[Dict[Tuple[str, str], ModuleType], Dict[Tuple[str, str], str]]:
+    """Import autogen submodules for all abbrs, overlapping across threads.
+
+    Returns (modules, errors), both keyed by (abbr, submodule).
+    """
+    modules: Dict[Tuple[str, str], ModuleType] = {}
+    errors: Dict[Tuple[str, str], str] = {}
+    if not abbrs:
+        return modules, errors
+    with ThreadPoolExecutor(max_workers=min(len(abbrs), os.cpu_count() or 1)) as ex:
+        per_abbr = list(ex.map(_import_autogen, abbrs))
+    for abbr, mods, errs in per_abbr:
+        for name, mod in mods.items():
+            modules[(abbr, name)] = mod
+        for name, err in errs.items():
+            errors[(abbr, name)] = err
+    return modules, errors
+
+
+@dataclass(frozen=True)
+class StageBSnapshot:
+    """State captured once per test session and shared by all B-Gate classes."""
+
+    abbrs: Tuple[str, ...]
+    manual_hashes: Mapping[str, str]  # taken BEFORE the generator ran
+    autogen_hashes: Mapping[str, str]
+    modules: Mapping[Tuple[str, str], ModuleType]  # (abbr, submodule) -> module
+    import_errors: Mapping[Tuple[str, str], str]  # (abbr, submodule) -> error
+    generator_stdout: str
+    generator_stderr: str
+
+
+_SNAP: Optional[StageBSnapshot] = None
+
+
+def _module_or_skip(test: unittest.TestCase, abbr: str, name: str) -> ModuleType:
+    """Return a pre-imported autogen module, or skip if it failed to import.
+
+    Import failures themselves are reported by test_autogen_modules_importable.
+    """
+    mod = _SNAP.modules.get((abbr, name))
+    if mod is None:
+        err = _SNAP.import_errors.get((abbr, name), "not imported")
+        test.skipTest(f"stageB.modules.{abbr}.{name} unavailable ({err})")
+    return mod
+
+
+def setUpModule() -> None:
+    global _SNAP
+    # Hash manual files that exist BEFORE generator
+    manual_hashes = _manual_files_hash_if_exist()
+
+    proc = _run_generator()
+    if proc.returncode != 0:
+        raise RuntimeError(
+            f"Stage B generator failed:\nSTDOUT:\n{proc.stdout}\nSTDERR:\n{proc.stderr}"
+        )
+
+    abbrs = _discover_contract_abbrs()
+    modules, import_errors = _import_all_autogen(abbrs)
+    _SNAP = StageBSnapshot(
+        abbrs=abbrs,
+        manual_hashes=MappingProxyType(manual_hashes),
+        autogen_hashes=MappingProxyType(_autogen_files_tree_hash()),
+        modules=MappingProxyType(modules),
+        import_errors=MappingProxyType(import_errors),
+        generator_stdout=proc.stdout,
+        generator_stderr=proc.stderr,
     )
 
 
 class TestStageBGateGeneration(unittest.TestCase):
     """B-Gate: Generator produces valid output."""
 
-    @classmethod
-    def setUpClass(cls) -> None:
-        proc = _run_generator()
-        if proc.returncode != 0:
-            raise RuntimeError(
-                f"Stage B generator failed:\nSTDOUT:\n{proc.stdout}\nSTDERR:\n{proc.stderr}"
-            )
-
     def test_contracts_discovered(self) -> None:
-        abbrs = _discover_contract_abbrs()
+        abbrs = _SNAP.abbrs
         self.assertTrue(abbrs, "No Stage A contracts discovered")
 
     def test_module_directories_exist(self) -> None:
-        abbrs = _discover_contract_abbrs()
+        abbrs = _SNAP.abbrs
         for abbr in abbrs:
             mod_dir = MODULES_DIR / abbr
             self.assertTrue(
@@ -126,7 +281,7 @@ class TestStageBGateGeneration(unittest.TestCase):
             )
 
     def test_all_autogen_files_exist(self) -> None:
-        abbrs = _discover_contract_abbrs()
+        abbrs = _SNAP.abbrs
         for abbr in abbrs:
             mod_dir = MODULES_DIR / abbr
             for fname in REQUIRED_AUTOGEN_FILES:
@@ -140,33 +295,25 @@ class TestStageBGateGeneration(unittest.TestCase):
 class TestStageBGateImports(unittest.TestCase):
     """B-Gate: All generated modules are importable."""
 
-    @classmethod
-    def setUpClass(cls) -> None:
-        proc = _run_generator()
-        if proc.returncode != 0:
-            raise RuntimeError(f"Generator failed: {proc.stderr}")
-
     def test_autogen_modules_importable(self) -> None:
-        abbrs = _discover_contract_abbrs()
+        abbrs = _SNAP.abbrs
         for abbr in abbrs:
-            for mod_name in [
-                f"stageB.modules.{abbr}.config_autogen",
-                f"stageB.modules.{abbr}.io_types_autogen",
-                f"stageB.modules.{abbr}.validators_autogen",
-                f"stageB.modules.{abbr}.pipeline_autogen",
-                f"stageB.modules.{abbr}.cli_autogen",
-            ]:
+            for name in AUTOGEN_SUBMODULES:
+                mod_name = f"stageB.modules.{abbr}.{name}"
                 with self.subTest(module=mod_name):
-                    __import__(mod_name)
+                    err = _SNAP.import_errors.get((abbr, name))
+                    self.assertIsNone(err, f"Import failed: {mod_name}: {err}")
+                    mod = _SNAP.modules.get((abbr, name))
+                    self.assertIsNotNone(mod, f"Not imported: {mod_name}")
+                    self.assertEqual(mod.__name__, mod_name)
 
 
 class TestStageBGateIdempotency(unittest.TestCase):
     """B-Gate: Generator is idempotent (autogen outputs)."""
 
     def test_idempotency(self) -> None:
-        proc1 = _run_generator()
-        self.assertEqual(proc1.returncode, 0, f"First run failed: {proc1.stderr}")
-        before = _autogen_files_tree_hash()
+        # First run happened in setUpModule
+        before = _SNAP.autogen_hashes
         self.assertTrue(before, "No *_autogen.* files found after first run")
 
         proc2 = _run_generator()
@@ -174,7 +321,7 @@ class TestStageBGateIdempotency(unittest.TestCase):
         after = _autogen_files_tree_hash()
 
         self.assertEqual(
-            before, after,
+            dict(before), after,
             "Idempotency violated: *_autogen.* outputs changed on second run"
         )
 
@@ -182,10 +329,6 @@ class TestStageBGateIdempotency(unittest.TestCase):
 class TestStageBGateSafety(unittest.TestCase):
     """B-Gate: Generator only writes allowed file set."""
 
-    @classmethod
-    def setUpClass(cls) -> None:
-        _run_generator()
-
     def test_no_unexpected_files(self) -> None:
         allowed_names = {
             "config_autogen.py",
@@ -200,13 +343,14 @@ class TestStageBGateSafety(unittest.TestCase):
         }
 
         unexpected: List[str] = []
-        for p in MODULES_DIR.rglob("*"):
-            if not p.is_file():
-                continue
-            if "__pycache__" in p.parts or p.suffix == ".pyc":
-                continue
-            if p.name not in allowed_names:
-                unexpected.append(p.relative_to(REPO_ROOT).as_posix())
+        for dirpath, dirnames, filenames in os.walk(MODULES_DIR, topdown=True):
+            # Prune __pycache__ before descending
+            dirnames[:] = [d for d in dirnames if d != "__pycache__"]
+            for name in filenames:
+                if name in allowed_names or name.endswith(".pyc"):
+                    continue
+                rel = (Path(dirpath) / name).relative_to(REPO_ROOT).as_posix()
+                unexpected.append(rel)
 
         self.assertFalse(
             unexpected,
@@ -217,42 +361,36 @@ class TestStageBGateSafety(unittest.TestCase):
 class TestStageBGateTraceability(unittest.TestCase):
     """B-Gate: Traceability markers exist (header + runtime constants)."""
 
-    @classmethod
-    def setUpClass(cls) -> None:
-        _run_generator()
-
     def test_autogen_headers_contain_sha(self) -> None:
-        abbrs = _discover_contract_abbrs()
-        for abbr in abbrs:
-            mod_dir = MODULES_DIR / abbr
-            for fname in [
-                "config_autogen.py",
-                "io_types_autogen.py",
-                "validators_autogen.py",
-                "pipeline_autogen.py",
-                "cli_autogen.py",
-            ]:
-                p = mod_dir / fname
-                with self.subTest(file=p.as_posix()):
-                    txt = p.read_text(encoding="utf-8", errors="replace")
-                    self.assertIn("contract_sha256:", txt)
+        abbrs = _SNAP.abbrs
+        paths = [
+            MODULES_DIR / abbr / f"{name}.py"
+            for abbr in abbrs
+            for name in AUTOGEN_SUBMODULES
+        ]
+        with ThreadPoolExecutor(max_workers=min(32, len(paths) or 1)) as ex:
+            contents = list(ex.map(_read_bytes_if_exists, paths))
+
+        for p, data in zip(paths, contents):
+            with self.subTest(file=p.as_posix()):
+                self.assertIsNotNone(data, f"Missing autogen file: {p}")
+                self.assertIn(b"contract_sha256:", data)
 
     def test_runtime_constants_exist(self) -> None:
-        abbrs = _discover_contract_abbrs()
+        required = {
+            "__contract_id__",
+            "__contract_version__",
+            "__schema_version__",
+            "__contract_sha256__",
+        }
+        abbrs = _SNAP.abbrs
         for abbr in abbrs:
-            mod = __import__(
-                f"stageB.modules.{abbr}.config_autogen",
-                fromlist=["__contract_id__", "__contract_sha256__", "__schema_version__"]
-            )
-            for attr in [
-                "__contract_id__",
-                "__contract_version__",
-                "__schema_version__",
-                "__contract_sha256__",
-            ]:
-                self.assertTrue(
-                    hasattr(mod, attr),
-                    f"{abbr}.config_autogen missing {attr}"
+            with self.subTest(module=abbr):
+                mod = _module_or_skip(self, abbr, "config_autogen")
+                missing = required - set(vars(mod))
+                self.assertFalse(
+                    missing,
+                    f"{abbr}.config_autogen missing {sorted(missing)}"
                 )
 
 
@@ -260,12 +398,8 @@ class TestStageBGateManualNotOverwritten(unittest.TestCase):
     """B-Gate: Manual files are not overwritten (if they already exist)."""
 
     def test_manual_files_not_modified(self) -> None:
-        # Hash manual files that exist BEFORE generator
-        before = _manual_files_hash_if_exist()
-
-        proc = _run_generator()
-        self.assertEqual(proc.returncode, 0, f"Generator failed: {proc.stderr}")
-
+        # Snapshot taken in setUpModule, before the generator ran
+        before = _SNAP.manual_hashes
         after = _manual_files_hash_if_exist()
 
         # Only compare keys that existed before (do not care about new manual files)
@@ -279,18 +413,11 @@ class TestStageBGateManualNotOverwritten(unittest.TestCase):
 class TestStageBGateStructure(unittest.TestCase):
     """B-Gate: Autogen files have proper structure."""
 
-    @classmethod
-    def setUpClass(cls) -> None:
-        _run_generator()
-
     def test_config_has_classvar_mapping(self) -> None:
-        abbrs = _discover_contract_abbrs()
+        abbrs = _SNAP.abbrs
         for abbr in abbrs:
             with self.subTest(module=abbr):
-                mod = __import__(
-                    f"stageB.modules.{abbr}.config_autogen",
-                    fromlist=["Parameters"]
-                )
+                mod = _module_or_skip(self, abbr, "config_autogen")
                 params_cls = mod.Parameters
                 self.assertTrue(
                     hasattr(params_cls, "__contract_field_map__"),
@@ -298,13 +425,10 @@ class TestStageBGateStructure(unittest.TestCase):
                 )
 
     def test_config_has_validate_ranges(self) -> None:
-        abbrs = _discover_contract_abbrs()
+        abbrs = _SNAP.abbrs
         for abbr in abbrs:
             with self.subTest(module=abbr):
-                mod = __import__(
-                    f"stageB.modules.{abbr}.config_autogen",
-                    fromlist=["Parameters"]
-                )
+                mod = _module_or_skip(self, abbr, "config_autogen")
                 params_cls = mod.Parameters
                 self.assertTrue(
                     callable(getattr(params_cls, "validate_ranges", None)),
@@ -312,13 +436,10 @@ class TestStageBGateStructure(unittest.TestCase):
                 )
 
     def test_config_has_from_contract_dict(self) -> None:
-        abbrs = _discover_contract_abbrs()
+        abbrs = _SNAP.abbrs
         for abbr in abbrs:
             with self.subTest(module=abbr):
-                mod = __import__(
-                    f"stageB.modules.{abbr}.config_autogen",
-                    fromlist=["Parameters"]
-                )
+                mod = _module_or_skip(self, abbr, "config_autogen")
                 params_cls = mod.Parameters
                 self.assertTrue(
                     callable(getattr(params_cls, "from_contract_dict", None)),
@@ -326,13 +447,10 @@ class TestStageBGateStructure(unittest.TestCase):
                 )
 
     def test_io_types_have_from_contract_dict(self) -> None:
-        abbrs = _discover_contract_abbrs()
+        abbrs = _SNAP.abbrs
         for abbr in abbrs:
             with self.subTest(module=abbr):
-                mod = __import__(
-                    f"stageB.modules.{abbr}.io_types_autogen",
-                    fromlist=["Inputs", "Outputs"]
-                )
+                mod = _module_or_skip(self, abbr, "io_types_autogen")
                 for cls_name in ["Inputs", "Outputs"]:
                     cls = getattr(mod, cls_name)
                     self.assertTrue(
@@ -344,55 +462,38 @@ class TestStageBGateStructure(unittest.TestCase):
 class TestStageBGateFunctionality(unittest.TestCase):
     """B-Gate: Basic functionality works."""
 
-    @classmethod
-    def setUpClass(cls) -> None:
-        _run_generator()
-
     def test_parameters_instantiate_with_defaults(self) -> None:
-        abbrs = _discover_contract_abbrs()
+        abbrs = _SNAP.abbrs
         for abbr in abbrs:
             with self.subTest(module=abbr):
-                mod = __import__(
-                    f"stageB.modules.{abbr}.config_autogen",
-                    fromlist=["Parameters"]
-                )
+                mod = _module_or_skip(self, abbr, "config_autogen")
                 params = mod.Parameters()
                 self.assertIsNotNone(params)
 
     def test_validate_ranges_returns_list(self) -> None:
-        abbrs = _discover_contract_abbrs()
+        abbrs = _SNAP.abbrs
         for abbr in abbrs:
             with self.subTest(module=abbr):
-                mod = __import__(
-                    f"stageB.modules.{abbr}.config_autogen",
-                    fromlist=["Parameters"]
-                )
+                mod = _module_or_skip(self, abbr, "config_autogen")
                 params = mod.Parameters()
                 result = params.validate_ranges()
                 self.assertIsInstance(result, list)
 
     def test_from_contract_dict_works(self) -> None:
-        abbrs = _discover_contract_abbrs()
+        abbrs = _SNAP.abbrs
         for abbr in abbrs:
             with self.subTest(module=abbr):
-                mod = __import__(
-                    f"stageB.modules.{abbr}.config_autogen",
-                    fromlist=["Parameters"]
-                )
+                mod = _module_or_skip(self, abbr, "config_autogen")
                 params = mod.Parameters.from_contract_dict({})
                 self.assertIsNotNone(params)
 
     def test_is_valid_returns_bool(self) -> None:
         """is_valid() returns boolean."""
-        abbrs = _discover_contract_abbrs()
+        abbrs = _SNAP.abbrs
         for abbr in abbrs:
             with self.subTest(module=abbr):
-                mod = __import__(
-                    f"stageB.modules.{abbr}.validators_autogen",
-                    fromlist=["is_valid"]
-                )
-                from importlib import import_module
-                config = import_module(f"stageB.modules.{abbr}.config_autogen")
+                mod = _module_or_skip(self, abbr, "validators_autogen")
+                config = _module_or_skip(self, abbr, "config_autogen")
                 params = config.Parameters()
                 result = mod.is_valid(params)
                 self.assertIsInstance(result, bool)